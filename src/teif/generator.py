@@ -54,6 +54,21 @@ class TEIFGenerator:
         Returns:
             str: Generated XML as a string with proper formatting
         """
+        return self.generate_teif_xml_bytes(data).decode('utf-8')
+
+    def generate_teif_xml_bytes(self, data: Dict[str, Any]) -> bytes:
+        """
+        Generate TEIF XML from the provided data as UTF-8 encoded bytes.
+        
+        Same as generate_teif_xml(), without decoding lxml's serialized
+        output into a Python string.
+        
+        Args:
+            data: Dictionary containing invoice data
+            
+        Returns:
+            bytes: Generated XML document, UTF-8 encoded
+        """
         try:
             # Create the root element
             root = create_teif_root(version=data.get('version', '1.8.8'))
@@ -120,8 +135,8 @@ class TEIFGenerator:
                     self._add_signature(root, signature_data)
             
             # Use our XML serialization utility
-            from .utils.xml_utils import serialize_xml
-            teif_xml = serialize_xml(root)
+            from .utils.xml_utils import serialize_xml_bytes
+            teif_xml = serialize_xml_bytes(root, encoding='UTF-8')
             
             # Créer le dossier output s'il n'existe pas
             os.makedirs('output', exist_ok=True)
@@ -131,7 +146,7 @@ class TEIFGenerator:
             output_file = f'output/teif_invoice_{timestamp}.xml'
             
             # Sauvegarder dans le fichier
-            with open(output_file, 'w', encoding='utf-8') as f:
+            with open(output_file, 'wb') as f:
                 f.write(teif_xml)
             
             print(f"Fichier TEIF généré avec succès : {output_file}")
@@ -13,6 +13,7 @@ from cryptography.x509 import load_pem_x509_certificate
 from cryptography.hazmat.backends import default_backend
 import copy
 import os
+from functools import lru_cache
 from cryptography.hazmat.primitives.asymmetric import padding, rsa, utils
 from cryptography.hazmat.primitives.serialization import load_pem_public_key
 from cryptography.hazmat.primitives.serialization import Encoding, PublicFormat
@@ -58,6 +59,12 @@ SIGNER_ROLE = f"{{{XADES_NS}}}SignerRole"
 CLAIMED_ROLES = f"{{{XADES_NS}}}ClaimedRoles"
 CLAIMED_ROLE = f"{{{XADES_NS}}}ClaimedRole"
 
+@lru_cache(maxsize=32)
+def _pem_certificate_der(cert_pem: bytes) -> bytes:
+    """Décode un certificat PEM en DER; le résultat est mis en cache par contenu PEM."""
+    cert = crypto.load_certificate(crypto.FILETYPE_PEM, cert_pem)
+    return crypto.dump_certificate(crypto.FILETYPE_ASN1, cert)
+
 class SignatureSection:
     """Classe pour gérer les signatures électroniques XAdES-B selon les spécifications d'El Fatoora."""
     
@@ -484,7 +491,6 @@ class SignatureSection:
             # 4. Sign the canonicalized SignedInfo
             from cryptography.hazmat.primitives.asymmetric import padding
             from cryptography.hazmat.primitives import hashes
-            from cryptography.hazmat.primitives.serialization import load_pem_private_key
             
             # Load the private key
             if isinstance(key_data, str):
@@ -493,6 +499,7 @@ class SignatureSection:
             if isinstance(key_password, str):
                 key_password = key_password.encode('utf-8')
                 
+            # Pas de cache: la clé privée et son mot de passe ne restent pas en mémoire
             private_key = load_pem_private_key(
                 key_data,
                 password=key_password,
@@ -622,8 +629,7 @@ class SignatureSection:
             cert_data = sig_data['cert_data']
             if isinstance(cert_data, str):
                 cert_data = cert_data.encode('utf-8')
-            cert = crypto.load_certificate(crypto.FILETYPE_PEM, cert_data)
-            cert_der = crypto.dump_certificate(crypto.FILETYPE_ASN1, cert)
+            cert_der = _pem_certificate_der(cert_data)
             x509_cert.text = base64.b64encode(cert_der).decode('ascii')
         
         # Create the SignatureValue element (will be filled in later)
@@ -690,8 +696,7 @@ class SignatureSection:
             cert_data = sig_data['cert_data']
             if isinstance(cert_data, str):
                 cert_data = cert_data.encode('utf-8')
-            cert = crypto.load_certificate(crypto.FILETYPE_PEM, cert_data)
-            cert_der = crypto.dump_certificate(crypto.FILETYPE_ASN1, cert)
+            cert_der = _pem_certificate_der(cert_data)
             digest = hashlib.sha256(cert_der).digest()
             cert_digest_value.text = base64.b64encode(digest).decode('ascii')
         
@@ -753,8 +758,8 @@ class SignatureSection:
         return signature
     
     def add_signature(self,
-                     cert_data: Union[str, bytes],
-                     key_data: Optional[Union[str, bytes]] = None,
+                     cert_data: Union[str, bytes, bytearray, memoryview],
+                     key_data: Optional[Union[str, bytes, bytearray, memoryview]] = None,
                      key_password: Optional[str] = None,
                      signature_id: Optional[str] = None,
                      role: Optional[str] = None,
@@ -764,8 +769,10 @@ class SignatureSection:
         Ajoute une signature à la section.
 
         Args:
-            cert_data: Données du certificat au format PEM ou chemin vers le fichier
-            key_data: Données de la clé privée ou chemin vers le fichier (optionnel)
+            cert_data: Données du certificat au format PEM (str, bytes, bytearray
+                ou memoryview) ou chemin vers le fichier
+            key_data: Clé privée au format PEM (str, bytes, bytearray ou memoryview)
+                ou chemin vers le fichier (optionnel)
             key_password: Mot de passe de la clé privée (optionnel)
             signature_id: Identifiant unique de la signature
             role: Rôle du signataire (optionnel)
@@ -783,8 +790,9 @@ class SignatureSection:
                         cert_content = f.read()
                 else:
                     cert_content = cert_data.encode('utf-8')
-            elif isinstance(cert_data, bytes):
-                cert_content = cert_data
+            elif isinstance(cert_data, (bytes, bytearray, memoryview)):
+                # bytes() ne copie pas un objet bytes; les autres tampons sont matérialisés ici
+                cert_content = bytes(cert_data)
             
             # Vérifier que le contenu du certificat a bien été chargé
             if cert_content is None:
@@ -837,6 +845,10 @@ class SignatureSection:
                     if os.path.isfile(key_data):
                         with open(key_data, 'rb') as f:
                             key_content = f.read()
+                    else:
+                        key_content = key_data.encode('utf-8')
+                elif isinstance(key_data, (bytes, bytearray, memoryview)):
+                    key_content = bytes(key_data)
                 
                 # Nettoyer la clé privée si nécessaire
                 if key_content and b'-----BEGIN' in key_content:
@@ -153,6 +153,7 @@ def add_tax_detail(parent: ET.Element, tax_data: Dict[str, Any], currency: str =
         ValueError: Si les données de taxe sont invalides
     """
     from .amounts import create_amount_element
+    SubElement = ET.SubElement  # liaison locale, évite ET.SubElement à chaque appel
     
     # Validation des champs obligatoires
     required_fields = ['code', 'rate', 'amount']
@@ -166,7 +167,7 @@ def add_tax_detail(parent: ET.Element, tax_data: Dict[str, Any], currency: str =
     
     try:
         # Création de l'élément de taxe
-        tax_elem = ET.SubElement(parent, "TaxTotal")
+        tax_elem = SubElement(parent, "TaxTotal")
         
         # Montant de la taxe
         create_amount_element(
@@ -180,7 +181,7 @@ def add_tax_detail(parent: ET.Element, tax_data: Dict[str, Any], currency: str =
         )
         
         # Détails de la taxe
-        tax_subtotal = ET.SubElement(tax_elem, "TaxSubtotal")
+        tax_subtotal = SubElement(tax_elem, "TaxSubtotal")
         
         # Montant taxable
         if 'taxable_amount' in tax_data:
@@ -195,21 +196,21 @@ def add_tax_detail(parent: ET.Element, tax_data: Dict[str, Any], currency: str =
             )
         
         # Taux de taxe
-        tax_category = ET.SubElement(tax_subtotal, "TaxCategory")
-        tax_scheme = ET.SubElement(tax_category, "TaxScheme")
-        ET.SubElement(
+        tax_category = SubElement(tax_subtotal, "TaxCategory")
+        tax_scheme = SubElement(tax_category, "TaxScheme")
+        SubElement(
             tax_scheme,
             "ID",
             schemeID=tax_data.get('code_scheme', 'I-1600')
         ).text = str(tax_data['code'])
         
         # Taux de taxe
-        tax_percent = ET.SubElement(tax_category, "Percent")
+        tax_percent = SubElement(tax_category, "Percent")
         tax_percent.text = str(tax_data['rate'])
         
         # Libellé de la taxe
         if 'name' in tax_data:
-            ET.SubElement(tax_category, "TaxExemptionReason").text = str(tax_data['name'])
+            SubElement(tax_category, "TaxExemptionReason").text = str(tax_data['name'])
     
     except (ValueError, TypeError) as e:
         raise ValueError(f"Format de données de taxe invalide: {str(e)}")
@@ -232,49 +233,51 @@ def add_invoice_tax_section(parent: ET.Element, tax_data: Dict[str, Any], curren
     if not tax_data or 'code' not in tax_data or 'type_name' not in tax_data or 'rate' not in tax_data or 'amount' not in tax_data:
         return
     
+    SubElement = ET.SubElement  # liaison locale, évite ET.SubElement à chaque appel
+    
     # Créer l'élément InvoiceTax
-    invoice_tax = ET.SubElement(parent, 'InvoiceTax')
+    invoice_tax = SubElement(parent, 'InvoiceTax')
     
     # Créer la section des détails de taxe
-    tax_details = ET.SubElement(invoice_tax, 'InvoiceTaxDetails')
+    tax_details = SubElement(invoice_tax, 'InvoiceTaxDetails')
     
     # Créer l'élément Tax
-    tax = ET.SubElement(tax_details, 'Tax')
+    tax = SubElement(tax_details, 'Tax')
     
     # Ajouter le type de taxe avec son code
-    tax_type = ET.SubElement(tax, 'TaxTypeName', code=str(tax_data['code']))
+    tax_type = SubElement(tax, 'TaxTypeName', code=str(tax_data['code']))
     tax_type.text = str(tax_data['type_name'])[:35]  # Limité à 35 caractères
     
     # Ajouter la catégorie de taxe si fournie
     if 'category' in tax_data and tax_data['category']:
-        category = ET.SubElement(tax, 'TaxCategory')
+        category = SubElement(tax, 'TaxCategory')
         category.text = str(tax_data['category'])[:6]  # Limité à 6 caractères
     
     # Ajouter les détails de la taxe (taux et base de calcul)
-    tax_details_elem = ET.SubElement(tax, 'TaxDetails')
+    tax_details_elem = SubElement(tax, 'TaxDetails')
     
     # Taux de taxe
-    rate = ET.SubElement(tax_details_elem, 'TaxRate')
+    rate = SubElement(tax_details_elem, 'TaxRate')
     rate.text = str(tax_data['rate'])
     
     # Base de calcul si fournie
     if 'basis' in tax_data and tax_data['basis'] is not None:
-        basis = ET.SubElement(tax_details_elem, 'TaxRateBasis')
+        basis = SubElement(tax_details_elem, 'TaxRateBasis')
         basis.text = str(tax_data['basis'])
     
     # Créer la section des montants
-    amount_details = ET.SubElement(tax, 'AmountDetails')
+    amount_details = SubElement(tax, 'AmountDetails')
     
     # Ajouter le montant de la taxe
-    moa = ET.SubElement(amount_details, 'Moa', amountTypeCode='TAX_AMOUNT')
+    moa = SubElement(amount_details, 'Moa', amountTypeCode='TAX_AMOUNT')
     
     # Montant de la taxe
-    amount = ET.SubElement(moa, 'Amount')
+    amount = SubElement(moa, 'Amount')
     amount.set('currencyIdentifier', tax_data.get('currency', currency))
     amount.text = str(tax_data['amount'])
     
     # Description du montant
-    desc = ET.SubElement(moa, 'AmountDescription', lang='FR')
+    desc = SubElement(moa, 'AmountDescription', lang='FR')
     desc.text = 'Montant de la taxe'
 
 def add_invoice_tax_section_old(parent: ET.Element, tax_data: Dict[str, Any], currency: str = 'TND') -> None:
@@ -3,9 +3,9 @@ Utils for XML handling and serialization.
 """
 from lxml import etree as ET
 
-def serialize_xml(element, encoding='UTF-8', xml_declaration=True, pretty_print=True):
+def serialize_xml_bytes(element, encoding='UTF-8', xml_declaration=True, pretty_print=True):
     """
-    Serialize XML element to string with proper formatting.
+    Serialize XML element to encoded bytes with proper formatting.
     
     Args:
         element: The root XML element to serialize
@@ -14,19 +14,38 @@ def serialize_xml(element, encoding='UTF-8', xml_declaration=True, pretty_print=
         pretty_print: Whether to format the output with indentation (default: True)
         
     Returns:
-        str: Formatted XML string
+        bytes: Formatted XML document in the requested encoding
     """
     # Ensure we have a proper XML tree
     if not hasattr(element, 'getroottree'):
         element = ET.ElementTree(element)
     
-    # Serialize to string with pretty printing
     return ET.tostring(
         element,
         xml_declaration=xml_declaration,
         encoding=encoding,
         pretty_print=pretty_print,
         standalone=True
+    )
+
+def serialize_xml(element, encoding='UTF-8', xml_declaration=True, pretty_print=True):
+    """
+    Serialize XML element to string with proper formatting.
+    
+    Args:
+        element: The root XML element to serialize
+        encoding: Output encoding (default: UTF-8)
+        xml_declaration: Whether to include XML declaration (default: True)
+        pretty_print: Whether to format the output with indentation (default: True)
+        
+    Returns:
+        str: Formatted XML string
+    """
+    return serialize_xml_bytes(
+        element,
+        encoding=encoding,
+        xml_declaration=xml_declaration,
+        pretty_print=pretty_print
     ).decode(encoding)
 
 def save_xml(element, file_path, encoding='UTF-8'):
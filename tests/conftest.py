@@ -4,6 +4,9 @@ Test configuration and fixtures for TEIF signature tests.
 import pytest
 from pathlib import Path
 
+# On-disk test certificate and key shared by the signature tests
+TEST_DATA_DIR = Path(__file__).parent / 'test_data'
+
 # Sample test data
 SAMPLE_XML = """<?xml version="1.0" encoding="UTF-8"?>
 <TEIF xmlns="urn:tunisie:teif:1.0.0">
@@ -69,6 +72,10 @@ o6pIJYjzAgMBAAECggEBAJwR5ZxXwqJx7QY5V8Kz8Q==
 -----END PRIVATE KEY-----
 """
 
+# Encoded once at import; the crypto APIs take bytes directly
+TEST_CERT_BYTES = TEST_CERT.encode('ascii')
+TEST_KEY_BYTES = TEST_KEY.encode('ascii')
+
 @pytest.fixture
 def sample_xml():
     """Return a sample TEIF XML document for testing."""
@@ -85,10 +92,39 @@ def test_key():
     return TEST_KEY
 
 @pytest.fixture
-def teif_signer(test_cert, test_key):
+def test_cert_bytes():
+    """Return the test certificate as PEM bytes."""
+    return TEST_CERT_BYTES
+
+@pytest.fixture
+def test_key_bytes():
+    """Return the test private key as PEM bytes."""
+    return TEST_KEY_BYTES
+
+@pytest.fixture(scope="session")
+def test_certificate():
+    """Return the on-disk test certificate and key as ``(cert_pem, key_pem)``.
+
+    The pair is generated once if missing and read a single time per session.
+    """
+    cert_path = TEST_DATA_DIR / 'test_cert.pem'
+    key_path = TEST_DATA_DIR / 'test_key.pem'
+    if not (cert_path.exists() and key_path.exists()):
+        from .generate_test_cert import generate_test_certificate
+        generate_test_certificate()
+    return cert_path.read_bytes(), key_path.read_bytes()
+
+@pytest.fixture
+def in_tmp_path(tmp_path, monkeypatch):
+    """Run the test from tmp_path: TEIFGenerator writes into ./output on every call."""
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+@pytest.fixture
+def teif_signer(test_cert_bytes, test_key_bytes):
     """Create and return a TEIFSigner instance for testing."""
-    from src.teif.signature import TEIFSigner
-    return TEIFSigner(test_cert, test_key)
+    from teif.signature import TEIFSigner
+    return TEIFSigner(test_cert_bytes, test_key_bytes)
 
 @pytest.fixture
 def signed_xml(teif_signer, sample_xml):
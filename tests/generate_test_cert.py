@@ -1,12 +1,25 @@
 """
 Script to generate a test certificate and private key for unit tests.
 """
+import os
 from pathlib import Path
 from cryptography import x509
 from cryptography.x509.oid import NameOID
 from cryptography.hazmat.primitives import hashes, serialization
 from cryptography.hazmat.primitives.asymmetric import rsa
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
+
+# Hash algorithm instance reused for every certificate signed here
+SIGNATURE_HASH = hashes.SHA256()
+
+# The tests only check XML structure, so a 1024-bit key is enough and is
+# several times faster to generate; set TEIF_TEST_KEY_SIZE=2048 for a
+# production-sized key.
+KEY_SIZE = int(os.environ.get('TEIF_TEST_KEY_SIZE', '1024'))
+
+# Fixed serial: test certificates need no uniqueness, and a constant keeps
+# regenerated certificates comparable
+TEST_SERIAL_NUMBER = int.from_bytes(b"TEIFTEST", "big")
 
 def generate_test_certificate():
     """Generate a test certificate and private key."""
@@ -20,10 +33,11 @@ def generate_test_certificate():
     # Generate private key
     key = rsa.generate_private_key(
         public_exponent=65537,
-        key_size=2048,
+        key_size=KEY_SIZE,
     )
     
-    # Generate self-signed certificate
+    # Generate self-signed certificate (one clock read for both bounds)
+    now = datetime.now(timezone.utc)
     subject = issuer = x509.Name([
         x509.NameAttribute(NameOID.COUNTRY_NAME, u"TN"),
         x509.NameAttribute(NameOID.ORGANIZATION_NAME, u"Test Organization"),
@@ -37,12 +51,12 @@ def generate_test_certificate():
     ).public_key(
         key.public_key()
     ).serial_number(
-        x509.random_serial_number()
+        TEST_SERIAL_NUMBER
     ).not_valid_before(
-        datetime.utcnow()
+        now
     ).not_valid_after(
-        datetime.utcnow() + timedelta(days=365)
-    ).sign(key, hashes.SHA256())
+        now + timedelta(days=365)
+    ).sign(key, SIGNATURE_HASH)
     
     # Write certificate
     with open(cert_path, 'wb') as f:
@@ -1,13 +1,8 @@
 """
 Test module for TEIF amounts section.
 """
-import sys
-import os
 import unittest
-import xml.etree.ElementTree as ET
-
-# Add the src directory to the Python path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), 'src')))
+from lxml import etree as ET
 
 from teif.sections.amounts import create_amount_element, create_tax_amount, create_line_amount
 
@@ -111,8 +106,8 @@ def generate_sample_amounts_xml():
     })
     
     # Format XML
-    from xml.dom import minidom
-    return minidom.parseString(ET.tostring(root, encoding='utf-8')).toprettyxml(indent="    ")
+    return ET.tostring(root, pretty_print=True, xml_declaration=True,
+                       encoding='utf-8').decode('utf-8')
 
 if __name__ == '__main__':
     # Run tests
@@ -1,5 +1,9 @@
-from src.teif.generator import TEIFGenerator
+from teif.generator import TEIFGenerator
 from datetime import datetime, timedelta
+import pytest
+
+# Run from tmp_path: the generator (and this test) write into ./output
+pytestmark = pytest.mark.usefixtures("in_tmp_path")
 
 def test_generator():
     # Create a minimal test invoice
@@ -1,14 +1,8 @@
 """
 Test module for TEIF invoice lines section.
 """
-import sys
-import os
 import unittest
-import xml.etree.ElementTree as ET
-from xml.dom import minidom
-
-# Add the src directory to the Python path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), 'src')))
+from lxml import etree as ET
 
 from teif.sections.lines import (
     add_invoice_lines,
@@ -192,8 +186,8 @@ def generate_sample_lines_xml():
     add_invoice_lines(invoice, lines)
     
     # Format the XML for better readability
-    return minidom.parseString(ET.tostring(root, encoding='utf-8'))\
-             .toprettyxml(indent="    ")
+    return ET.tostring(root, pretty_print=True, xml_declaration=True,
+                       encoding='utf-8').decode('utf-8')
 
 if __name__ == '__main__':
     # Run tests
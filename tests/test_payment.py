@@ -1,123 +1,123 @@
 """
 Test module for TEIF payment section.
 """
-import sys
-import os
-import unittest
-import xml.etree.ElementTree as ET
+import pytest
+from lxml import etree as ET
 from datetime import datetime, timedelta
-from xml.dom import minidom
-
-# Add the src directory to the Python path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), 'src')))
 
 from teif.sections.payment import add_payment_terms
 
-class TestPaymentSection(unittest.TestCase):
-    """Test cases for the payment section of TEIF documents."""
+# Assertion queries compiled once instead of on every find() call
+_FIND_CODE = ET.XPath("PaymentTermsTypeCode[@listID='I-100']")
+_FIND_MEANS = ET.XPath("PaymentMeans/PaymentMeansCode[@listID='I-110']")
+_FIND_DURATION_DAY = ET.XPath("DurationMeasure[@unitCode='DAY']")
 
-    def setUp(self):
-        """Set up test fixtures."""
-        self.parent = ET.Element('TestRoot')
-        self.today = datetime.now()
-        self.due_date = self.today + timedelta(days=30)
+# Frozen reference dates: deterministic and no clock lookup per fixture
+_NOW = datetime(2024, 1, 15, 10, 0, 0)
+_DUE_DATE = _NOW + timedelta(days=30)
+_DISCOUNT_DATE = _NOW + timedelta(days=10)
 
-    def test_add_basic_payment_terms(self):
-        """Test adding basic payment terms."""
-        payment_data = {
-            'code': 'I-101',  # Paiement comptant
-            'description': 'Paiement à 30 jours',
-            'due_date': self.due_date,
-            'means_of_payment': 'I-111'  # Virement bancaire
-        }
-        
-        add_payment_terms(self.parent, payment_data)
-        
-        # Vérifier la structure de base
-        terms = self.parent.find('PaymentTerms')
-        self.assertIsNotNone(terms)
-        
-        # Vérifier le code de paiement
-        code = terms.find("PaymentTermsTypeCode[@listID='I-100']")
-        self.assertEqual(code.text, 'I-101')
-        
-        # Vérifier la description
-        self.assertEqual(terms.find('Note').text, 'Paiement à 30 jours')
-        
-        # Vérifier la date d'échéance
-        due_date = terms.find('Settlement/PaymentDueDate')
-        self.assertEqual(due_date.text, self.due_date.strftime('%Y-%m-%d'))
-        
-        # Vérifier le moyen de paiement
-        means = terms.find("PaymentMeans/PaymentMeansCode[@listID='I-110']")
-        self.assertEqual(means.text, 'I-111')
+# Expected ISO strings, formatted once (date.isoformat() == '%Y-%m-%d')
+_NOW_STR = _NOW.date().isoformat()
+_DUE_DATE_STR = _DUE_DATE.date().isoformat()
+_DISCOUNT_DATE_STR = _DISCOUNT_DATE.date().isoformat()
+
+@pytest.fixture
+def parent_element():
+    """Return a fresh root element for each test (the builders mutate it)."""
+    return ET.Element('TestRoot')
+
+def test_add_basic_payment_terms(parent_element):
+    """Test adding basic payment terms."""
+    payment_data = {
+        'code': 'I-101',  # Paiement comptant
+        'description': 'Paiement à 30 jours',
+        'due_date': _DUE_DATE,
+        'means_of_payment': 'I-111'  # Virement bancaire
+    }
+    
+    add_payment_terms(parent_element, payment_data)
+    
+    # Vérifier la structure de base
+    terms = parent_element.find('PaymentTerms')
+    assert terms is not None
+    
+    # Vérifier le code de paiement
+    code = _FIND_CODE(terms)[0]
+    assert code.text == 'I-101'
+    
+    # Vérifier la description
+    assert terms.find('Note').text == 'Paiement à 30 jours'
+    
+    # Vérifier la date d'échéance
+    due_date = terms.find('Settlement/PaymentDueDate')
+    assert due_date.text == _DUE_DATE_STR
+    
+    # Vérifier le moyen de paiement
+    means = _FIND_MEANS(terms)[0]
+    assert means.text == 'I-111'
 
-    def test_add_payment_with_discount(self):
-        """Test adding payment terms with discount."""
-        discount_date = self.today + timedelta(days=10)
-        
-        payment_data = {
-            'code': 'I-102',  # Paiement à terme
-            'due_date': self.due_date,
-            'means_of_payment': 'I-111',
-            'discount_terms': {
-                'amount': 50.0,
-                'rate': 2.0,  # 2%
-                'currency': 'TND',
-                'period': {
-                    'end_date': discount_date,
-                    'base_date': self.today
-                }
+def test_add_payment_with_discount(parent_element):
+    """Test adding payment terms with discount."""
+    payment_data = {
+        'code': 'I-102',  # Paiement à terme
+        'due_date': _DUE_DATE,
+        'means_of_payment': 'I-111',
+        'discount_terms': {
+            'amount': 50.0,
+            'rate': 2.0,  # 2%
+            'currency': 'TND',
+            'period': {
+                'end_date': _DISCOUNT_DATE,
+                'base_date': _NOW
             }
         }
-        
-        add_payment_terms(self.parent, payment_data)
-        
-        # Vérifier la remise
-        discount = self.parent.find('.//Discount')
-        self.assertIsNotNone(discount)
-        
-        # Vérifier le montant de la remise
-        amount = discount.find('Amount')
-        self.assertEqual(amount.text, '50.0')
-        self.assertEqual(amount.get('currencyID'), 'TND')
-        
-        # Vérifier le taux de remise
-        self.assertEqual(discount.find('Rate').text, '2.0')
-        
-        # Vérifier la période de remise
-        period = discount.find('DiscountPeriod')
-        self.assertEqual(period.find('EndDate').text, discount_date.strftime('%Y-%m-%d'))
-        self.assertEqual(period.find('BaseDate').text, self.today.strftime('%Y-%m-%d'))
+    }
+    
+    add_payment_terms(parent_element, payment_data)
+    
+    # Vérifier la remise
+    discount = parent_element.find('.//Discount')
+    assert discount is not None
+    
+    # Vérifier le montant de la remise
+    amount = discount.find('Amount')
+    assert amount.text == '50.0'
+    assert amount.get('currencyID') == 'TND'
+    
+    # Vérifier le taux de remise
+    assert discount.find('Rate').text == '2.0'
+    
+    # Vérifier la période de remise
+    period = discount.find('DiscountPeriod')
+    assert period.find('EndDate').text == _DISCOUNT_DATE_STR
+    assert period.find('BaseDate').text == _NOW_STR
 
-    def test_add_payment_with_period(self):
-        """Test adding payment terms with period."""
-        start_date = self.today
-        end_date = self.today + timedelta(days=30)
-        
-        payment_data = {
-            'code': 'I-103',  # Paiement échelonné
-            'terms': {
-                'start_date': start_date,
-                'end_date': end_date,
-                'duration': 30  # jours
-            },
-            'means_of_payment': 'I-112'  # Chèque
-        }
-        
-        add_payment_terms(self.parent, payment_data)
-        
-        # Vérifier la période de paiement
-        period = self.parent.find('.//PaymentPeriod')
-        self.assertIsNotNone(period)
-        
-        # Vérifier les dates
-        self.assertEqual(period.find('StartDate').text, start_date.strftime('%Y-%m-%d'))
-        self.assertEqual(period.find('EndDate').text, end_date.strftime('%Y-%m-%d'))
-        
-        # Vérifier la durée
-        duration = period.find("DurationMeasure[@unitCode='DAY']")
-        self.assertEqual(duration.text, '30')
+def test_add_payment_with_period(parent_element):
+    """Test adding payment terms with period."""
+    payment_data = {
+        'code': 'I-103',  # Paiement échelonné
+        'terms': {
+            'start_date': _NOW,
+            'end_date': _DUE_DATE,
+            'duration': 30  # jours
+        },
+        'means_of_payment': 'I-112'  # Chèque
+    }
+    
+    add_payment_terms(parent_element, payment_data)
+    
+    # Vérifier la période de paiement
+    period = parent_element.find('.//PaymentPeriod')
+    assert period is not None
+    
+    # Vérifier les dates
+    assert period.find('StartDate').text == _NOW_STR
+    assert period.find('EndDate').text == _DUE_DATE_STR
+    
+    # Vérifier la durée
+    duration = _FIND_DURATION_DAY(period)[0]
+    assert duration.text == '30'
 
 def generate_sample_payment_xml():
     """Generate a sample XML with payment terms section."""
@@ -127,22 +127,18 @@ def generate_sample_payment_xml():
     invoice = ET.SubElement(root, 'Invoice')
     
     # Add payment terms
-    today = datetime.now()
-    due_date = today + timedelta(days=30)
-    discount_date = today + timedelta(days=10)
-    
     payment_data = {
         'code': 'I-102',  # Paiement à terme
         'description': 'Paiement à 30 jours avec escompte de 2% pour paiement sous 10 jours',
-        'due_date': due_date,
+        'due_date': _DUE_DATE,
         'means_of_payment': 'I-111',  # Virement bancaire
         'discount_terms': {
             'amount': 200.0,
             'rate': 2.0,  # 2%
             'currency': 'TND',
             'period': {
-                'end_date': discount_date,
-                'base_date': today
+                'end_date': _DISCOUNT_DATE,
+                'base_date': _NOW
             }
         }
     }
@@ -151,12 +147,12 @@ def generate_sample_payment_xml():
     add_payment_terms(invoice, payment_data)
     
     # Format the XML for better readability
-    return minidom.parseString(ET.tostring(root, encoding='utf-8'))\
-             .toprettyxml(indent="    ")
+    return ET.tostring(root, pretty_print=True, xml_declaration=True,
+                       encoding='utf-8').decode('utf-8')
 
 if __name__ == '__main__':
     # Run tests
-    unittest.main(argv=['first-arg-is-ignored'], exit=False)
+    pytest.main([__file__])
     
     # Show sample XML
     print("\n=== Exemple de sortie XML des conditions de paiement TEIF ===")
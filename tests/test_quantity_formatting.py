@@ -1,15 +1,19 @@
 """
 Test script to verify quantity formatting in TEIF XML output.
 """
-import sys
 import os
 import xml.etree.ElementTree as ET
 
-# Add the src directory to the Python path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), 'src')))
-
 from teif.generator import TEIFGenerator
 
+# Clark-notation tags: no prefix map to resolve in iter()/findall()
+TEIF_NS = 'urn:tunisiandatastandard:standard:teif:teif-invoice:1.8.8'
+INVOICE_LINE_TAG = f'{{{TEIF_NS}}}InvoiceLine'
+TAX_TOTAL_TAG = f'{{{TEIF_NS}}}TaxTotal'
+
+# Set TEIF_SAVE_TEST_XML=1 to keep the generated XML on disk for inspection
+SAVE_TEST_XML = bool(os.environ.get('TEIF_SAVE_TEST_XML'))
+
 def test_quantity_formatting():
     """Test different quantity formats in invoice lines."""
     # Initialize the generator
@@ -126,13 +130,14 @@ def test_quantity_formatting():
         root = ET.fromstring(xml_str)
     except ET.ParseError as e:
         print(f"\n❌ Erreur de parsing XML: {e}")
-        with open('error_xml.xml', 'w', encoding='utf-8') as f:
-            f.write(xml_str)
-        print("Le XML avec erreur a été enregistré dans 'error_xml.xml'")
-        return
+        if SAVE_TEST_XML:
+            with open('error_xml.xml', 'w', encoding='utf-8') as f:
+                f.write(xml_str)
+            print("Le XML avec erreur a été enregistré dans 'error_xml.xml'")
+        raise
     
     # Register the TEIF namespace
-    namespaces = {'teif': 'urn:tunisiandatastandard:standard:teif:teif-invoice:1.8.8'}
+    namespaces = {'teif': TEIF_NS}
     
     # Vérification de la structure de base
     print("\n=== Vérification de la structure TEIF 1.8.8 ===")
@@ -159,7 +164,7 @@ def test_quantity_formatting():
             print("✅ Toutes les sections obligatoires sont présentes dans InvoiceBody")
             
             # Vérification des lignes de facture
-            lines = body.findall('.//teif:InvoiceLine', namespaces)
+            lines = list(body.iter(INVOICE_LINE_TAG))
             if not lines:
                 print("❌ Aucune ligne de facture trouvée")
             else:
@@ -184,7 +189,7 @@ def test_quantity_formatting():
                       f"{line_total.get('currencyID') if line_total is not None else ''}")
                 
                 # Vérification des taxes
-                taxes = first_line.findall('teif:TaxTotal', namespaces)
+                taxes = first_line.findall(TAX_TOTAL_TAG)  # enfants directs uniquement
                 if taxes:
                     print(f"\nTaxes appliquées: {len(taxes)}")
                     for i, tax in enumerate(taxes, 1):
@@ -198,9 +203,10 @@ def test_quantity_formatting():
                     print("\n⚠ Aucune taxe spécifiée sur la première ligne")
     
     # Save the test XML for inspection
-    with open('test_quantity_formatting.xml', 'w', encoding='utf-8') as f:
-        f.write(xml_str)
-    print("\nTest XML saved to 'test_quantity_formatting.xml'")
+    if SAVE_TEST_XML:
+        with open('test_quantity_formatting.xml', 'w', encoding='utf-8') as f:
+            f.write(xml_str)
+        print("\nTest XML saved to 'test_quantity_formatting.xml'")
 
 if __name__ == "__main__":
     test_quantity_formatting()
@@ -1,17 +1,17 @@
 """
 Script de test pour vérifier la correction des espaces de noms dans la signature XML.
 """
-import sys
-import os
 from pathlib import Path
+import pytest
 from lxml import etree
 
-# Ajouter le répertoire src au path
-sys.path.append(str(Path(__file__).parent / 'src'))
-
 from teif.sections.signature import sign_xml
 
-def test_signature_namespaces():
+# Parseur partagé : pas de nœuds blancs ni de table d'ID pour une inspection ponctuelle
+_PARSER = etree.XMLParser(remove_blank_text=True, collect_ids=False,
+                          resolve_entities=False, no_network=True)
+
+def test_signature_namespaces(test_certificate):
     # Données de test
     test_xml = """<?xml version="1.0" encoding="UTF-8"?>
     <TEIF xmlns="http://www.tn.gov/teif"
@@ -32,17 +32,8 @@ def test_signature_namespaces():
         </InvoiceBody>
     </TEIF>"""
 
-    # Chemin vers le certificat et la clé de test
-    test_dir = Path(__file__).parent / 'tests' / 'test_data'
-    cert_path = test_dir / 'test_cert.pem'
-    key_path = test_dir / 'test_key.pem'
-
-    # Lire le certificat et la clé
-    with open(cert_path, 'rb') as f:
-        cert_data = f.read()
-    
-    with open(key_path, 'rb') as f:
-        key_data = f.read()
+    # Certificat et clé de test partagés pour la session
+    cert_data, key_data = test_certificate
 
     # Signer le document
     signed_xml = sign_xml(test_xml, cert_data, key_data)
@@ -57,7 +48,7 @@ def test_signature_namespaces():
     print(f"Document signé enregistré sous : {output_path}")
     
     # Vérifier les espaces de noms
-    root = etree.fromstring(signed_xml)
+    root = etree.fromstring(signed_xml, _PARSER)
     nsmap = root.nsmap
     
     print("\nEspaces de noms trouvés :")
@@ -71,4 +62,5 @@ def test_signature_namespaces():
     print("\nTest réussi : les espaces de noms sont correctement définis.")
 
 if __name__ == "__main__":
-    test_signature_namespaces()
+    # Le certificat de test vient d'une fixture pytest : passer par pytest
+    pytest.main([__file__])
@@ -1,163 +1,137 @@
 """
 Test module for TEIF taxes section.
 """
-import sys
 import os
-import unittest
-import xml.etree.ElementTree as ET
-from xml.dom import minidom
-
-# Add the src directory to the Python path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), 'src')))
+import sys
+import pytest
+from lxml import etree as ET
 
 from teif.sections.taxes import (
     add_tax_detail,
     add_invoice_tax_section
 )
 
-class TestTaxesSection(unittest.TestCase):
-    """Test cases for the taxes section of TEIF documents."""
+# Expressions XPath compilées une seule fois pour toutes les assertions
+_XP_AMOUNT_160 = ET.XPath('.//Amount[@amountTypeCode="I-160"]')
+_XP_AMOUNT_162 = ET.XPath('.//Amount[@amountTypeCode="I-162"]')
+_XP_SCHEME_ID = ET.XPath('.//TaxScheme/ID')
+_XP_PERCENT = ET.XPath('.//Percent')
 
-    def setUp(self):
-        """Set up test fixtures."""
-        self.parent = ET.Element('TestRoot')
-        self.currency = 'TND'
+# Données de taxe communes aux tests et à l'exemple XML
+BASIC_TAX = {
+    'code': 'I-1602',
+    'name': 'TVA',
+    'rate': 19.0,
+    'amount': 190.0,
+    'taxable_amount': 1000.0
+}
 
-    def test_add_tax_detail_basic(self):
-        """Test adding a basic tax detail."""
-        tax_data = {
-            'code': 'I-1602',
-            'name': 'TVA',
+INVOICE_TAXES = {
+    'amount': 228.0,  # Total des taxes
+    'taxes': [
+        {
+            'code': 'I-1602',  # TVA 19%
+            'name': 'TVA 19%',
             'rate': 19.0,
             'amount': 190.0,
             'taxable_amount': 1000.0
+        },
+        {
+            'code': 'I-1603',  # Droit de timbre
+            'name': 'Droit de timbre',
+            'rate': 1.0,
+            'amount': 10.0,
+            'taxable_amount': 1000.0
+        },
+        {
+            'code': 'I-1604',  # Autre taxe
+            'name': 'Taxe spéciale',
+            'rate': 2.8,
+            'amount': 28.0,
+            'taxable_amount': 1000.0
         }
-        
-        add_tax_detail(self.parent, tax_data, self.currency)
-        
-        # Vérifier la structure de base
-        tax_total = self.parent.find('TaxTotal')
-        self.assertIsNotNone(tax_total)
-        
-        # Vérifier le montant de la taxe
-        amount = tax_total.find('.//Amount[@amountTypeCode="I-160"]')
-        self.assertEqual(amount.text, '190.000')
-        self.assertEqual(amount.get('currencyID'), 'TND')
-        
-        # Vérifier le montant taxable
-        taxable = tax_total.find('.//Amount[@amountTypeCode="I-162"]')
-        self.assertEqual(taxable.text, '1000.000')
-        
-        # Vérifier le code de taxe
-        tax_scheme = tax_total.find('.//TaxScheme/ID')
-        self.assertEqual(tax_scheme.text, 'I-1602')
-        
-        # Vérifier le taux de TVA
-        percent = tax_total.find('.//Percent')
-        self.assertEqual(percent.text, '19.0')
+    ]
+}
 
-    def test_add_invoice_tax_section(self):
-        """Test adding a complete tax section to an invoice."""
-        tax_data = {
-            'amount': 228.0,  # Total des taxes
-            'taxes': [
-                {
-                    'code': 'I-1602',  # TVA 19%
-                    'name': 'TVA 19%',
-                    'rate': 19.0,
-                    'amount': 190.0,
-                    'taxable_amount': 1000.0
-                },
-                {
-                    'code': 'I-1603',  # Droit de timbre
-                    'name': 'Droit de timbre',
-                    'rate': 1.0,
-                    'amount': 10.0,
-                    'taxable_amount': 1000.0
-                },
-                {
-                    'code': 'I-1604',  # Autre taxe
-                    'name': 'Taxe spéciale',
-                    'rate': 2.8,
-                    'amount': 28.0,
-                    'taxable_amount': 1000.0
-                }
-            ]
-        }
-        
-        add_invoice_tax_section(self.parent, tax_data, self.currency)
-        
-        # Vérifier le montant total des taxes
-        tax_total = self.parent.find('TaxTotal')
-        self.assertIsNotNone(tax_total)
-        
-        # Vérifier le montant total
-        total_amount = tax_total.find('.//Amount[@amountTypeCode="I-160"]')
-        self.assertEqual(total_amount.text, '228.000')
-        
-        # Vérifier le nombre de taxes (chaque taxe est dans son propre TaxTotal)
-        taxes = tax_total.findall('TaxTotal')
-        self.assertEqual(len(taxes), 3)
-        
-        # Vérifier les codes de taxe
-        tax_codes = [t.find('.//TaxScheme/ID').text for t in taxes]
-        self.assertIn('I-1602', tax_codes)  # TVA
-        self.assertIn('I-1603', tax_codes)  # Droit de timbre
-        self.assertIn('I-1604', tax_codes)  # Autre taxe
+CURRENCY = 'TND'
+
+@pytest.fixture(scope="module")
+def basic_tax_total():
+    """Build the basic tax detail once; the tests only read it."""
+    root = ET.Element('TestRoot')
+    add_tax_detail(root, BASIC_TAX, CURRENCY)
+    return root.find('TaxTotal')
 
-    def test_tax_detail_missing_fields(self):
-        """Test adding a tax detail with missing required fields."""
-        with self.assertRaises(ValueError) as context:
-            add_tax_detail(self.parent, {'code': 'I-1602'}, self.currency)
-        
-        self.assertIn("Champs de taxe manquants", str(context.exception))
+@pytest.fixture(scope="module")
+def invoice_tax_total():
+    """Build the invoice tax section once; the tests only read it."""
+    root = ET.Element('TestRoot')
+    add_invoice_tax_section(root, INVOICE_TAXES, CURRENCY)
+    return root.find('TaxTotal')
 
-def generate_sample_taxes_xml():
-    """Generate a sample XML with taxes section."""
-    root = ET.Element('TEIF', version='1.8.8', controllingAgency='TTN')
+@pytest.mark.parametrize("xpath,attribute,expected", [
+    (_XP_AMOUNT_160, None, '190.000'),          # Montant de la taxe
+    (_XP_AMOUNT_160, 'currencyID', 'TND'),
+    (_XP_AMOUNT_162, None, '1000.000'),         # Montant taxable
+    (_XP_SCHEME_ID, None, 'I-1602'),            # Code de taxe
+    (_XP_PERCENT, None, '19.0'),                # Taux de TVA
+], ids=['amount', 'currency', 'taxable_amount', 'code', 'percent'])
+def test_add_tax_detail_basic(basic_tax_total, xpath, attribute, expected):
+    """Test adding a basic tax detail."""
+    assert basic_tax_total is not None
+    elem = xpath(basic_tax_total)[0]
+    value = elem.text if attribute is None else elem.get(attribute)
+    assert value == expected
+
+def test_add_invoice_tax_section(invoice_tax_total):
+    """Test adding a complete tax section to an invoice."""
+    # Vérifier le montant total des taxes
+    tax_total = invoice_tax_total
+    assert tax_total is not None
     
-    # Add invoice data
-    invoice = ET.SubElement(root, 'Invoice')
+    # Vérifier le montant total
+    total_amount = _XP_AMOUNT_160(tax_total)[0]
+    assert total_amount.text == '228.000'
     
-    # Add taxes section
-    taxes_data = {
-        'amount': 228.0,
-        'taxes': [
-            {
-                'code': 'I-1602',  # TVA 19%
-                'name': 'TVA 19%',
-                'rate': 19.0,
-                'amount': 190.0,
-                'taxable_amount': 1000.0
-            },
-            {
-                'code': 'I-1603',  # Droit de timbre
-                'name': 'Droit de timbre',
-                'rate': 1.0,
-                'amount': 10.0,
-                'taxable_amount': 1000.0
-            },
-            {
-                'code': 'I-1604',  # Autre taxe
-                'name': 'Taxe spéciale',
-                'rate': 2.8,
-                'amount': 28.0,
-                'taxable_amount': 1000.0
-            }
-        ]
-    }
+    # Vérifier le nombre de taxes (chaque taxe est dans son propre TaxTotal)
+    taxes = tax_total.findall('TaxTotal')
+    assert len(taxes) == 3
     
+    # Indexer chaque TaxTotal par son code de taxe en un seul parcours
+    by_code = {}
+    for scheme_id in tax_total.iter('ID'):
+        if scheme_id.getparent().tag == 'TaxScheme':
+            by_code[scheme_id.text] = next(scheme_id.iterancestors('TaxTotal'))
+    # TVA, droit de timbre, autre taxe
+    assert {'I-1602', 'I-1603', 'I-1604'} <= by_code.keys()
+    assert set(by_code.values()) == set(taxes)
+
+def test_tax_detail_missing_fields():
+    """Test adding a tax detail with missing required fields."""
+    with pytest.raises(ValueError, match="Champs de taxe manquants"):
+        add_tax_detail(ET.Element('TestRoot'), {'code': 'I-1602'}, CURRENCY)
+
+def write_sample_taxes_xml(out=None):
+    """Write a sample XML with taxes section to a binary stream (stdout by default)."""
+    if out is None:
+        out = sys.stdout.buffer
+
     # Add taxes to invoice
-    add_invoice_tax_section(invoice, taxes_data)
-    
-    # Format the XML for better readability
-    return minidom.parseString(ET.tostring(root, encoding='utf-8'))\
-             .toprettyxml(indent="    ")
+    invoice = ET.Element('Invoice')
+    add_invoice_tax_section(invoice, INVOICE_TAXES)
+
+    # Stream the document instead of building and re-serializing a full tree
+    with ET.xmlfile(out, encoding='utf-8') as xf:
+        xf.write_declaration()
+        with xf.element('TEIF', version='1.8.8', controllingAgency='TTN'):
+            xf.write('\n')
+            xf.write(invoice, pretty_print=True)
 
 if __name__ == '__main__':
     # Run tests
-    unittest.main(argv=['first-arg-is-ignored'], exit=False)
+    pytest.main([__file__])
     
-    # Show sample XML
-    print("\n=== Exemple de sortie XML des taxes TEIF ===")
-    print(generate_sample_taxes_xml())
+    # Show sample XML (opt-in: TEIF_SAMPLE_XML=1)
+    if os.environ.get('TEIF_SAMPLE_XML'):
+        print("\n=== Exemple de sortie XML des taxes TEIF ===", flush=True)
+        write_sample_taxes_xml()